@@ -1,16 +1,216 @@
 
+import os
 import sys
 import pandas as pd
 import numpy as np
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
-    QLabel, QLineEdit, QFileDialog, QMessageBox, QTableView
+    QLabel, QLineEdit, QFileDialog, QMessageBox, QTableView, QProgressBar
 )
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QStandardItemModel, QStandardItem
-from matplotlib.figure import Figure
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
+from PyQt5.QtCore import Qt, QAbstractTableModel, QObject, QRunnable, QThreadPool, QLocale, pyqtSignal
+from PyQt5.QtGui import QDoubleValidator
+import pyqtgraph as pg
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv  # Optional: fast multithreaded / streaming CSV parser
+    import pyarrow.feather as feather
+except ImportError:
+    pa = pacsv = feather = None
+
+try:
+    import bottleneck as bn  # Optional: fast C loops for NaN-aware reductions
+    nanmax, nanmean = bn.nanmax, bn.nanmean
+except ImportError:
+    nanmax, nanmean = np.nanmax, np.nanmean
+
+try:
+    from numba import njit  # Optional: JIT for the unsorted average kernel
+except ImportError:
+    njit = None
+
+
+CHUNKED_READ_BYTES = 64 * 1024 * 1024  # Files at least this large are read in chunks
+CSV_CHUNK_ROWS = 1_000_000  # Rows per chunk for the chunked reader
+FEATHER_SUFFIX = '.ft'  # Sidecar cache written next to a parsed CSV file
+FEATHER_SOURCE_KEY = b'static_thrust_source'  # Schema metadata: size/mtime of the cached CSV
+CSV_COLUMN_RENAMES = {'Time (s)': 'time', 'Thrust (ozf)': 'thrust'}  # CSV header -> internal name
+# The only columns we use; time stays float64 so long/epoch timestamps and range edges stay exact
+COLUMN_DTYPES = {'time': np.float64, 'thrust': np.float32}
+
+
+def read_thrust_csv(file_path, progress=None):
+    """
+    Load a CSV file, using its Feather sidecar when it was written from this exact file
+    (same size and modification time, recorded in the sidecar's schema metadata).
+    After a fresh parse of a usable file the sidecar is (re)written on a best-effort basis.
+    """
+    feather_path = file_path + FEATHER_SUFFIX
+    stat = os.stat(file_path)
+    source = f"{stat.st_size}:{stat.st_mtime_ns}".encode()
+    if feather is not None and os.path.exists(feather_path):
+        try:
+            table = feather.read_table(feather_path)
+            if (table.schema.metadata or {}).get(FEATHER_SOURCE_KEY) == source:
+                return table.to_pandas()
+        except Exception:
+            pass  # Unreadable cache; fall back to parsing the CSV
+
+    df = parse_thrust_csv(file_path, progress)
+    # Only cache frames the app will accept (all-numeric checks still happen on load)
+    if feather is not None and all(c in df.columns.map(lambda c: CSV_COLUMN_RENAMES.get(c, c))
+                                   for c in COLUMN_DTYPES):
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            metadata = dict(table.schema.metadata or {})
+            metadata[FEATHER_SOURCE_KEY] = source
+            feather.write_feather(table.replace_schema_metadata(metadata), feather_path)
+        except Exception:
+            pass  # The cache is optional (e.g. read-only directory)
+    return df
+
+
+def parse_thrust_csv(file_path, progress=None):
+    """
+    Read a CSV file into a pandas DataFrame.
+    The time/thrust columns are always parsed with fixed dtypes, under either accepted name.
+    Only those two are read when the header has 'Time (s)'/'Thrust (ozf)'; otherwise every
+    column is read so the caller can report what is missing.
+    Files smaller than CHUNKED_READ_BYTES are parsed in one go (multithreaded with pyarrow).
+    Larger files are read incrementally so progress(percent) can be reported: pyarrow streams
+    batches from a memory-mapped file, pandas reads chunks.
+    """
+    file_size = os.path.getsize(file_path)
+    header = pd.read_csv(file_path, nrows=0).columns
+    # Fixed types stop pyarrow's streaming reader from inferring int64 from the first block
+    dtype = {c: COLUMN_DTYPES[CSV_COLUMN_RENAMES.get(c, c)] for c in header
+             if CSV_COLUMN_RENAMES.get(c, c) in COLUMN_DTYPES}
+    usecols = list(CSV_COLUMN_RENAMES) if all(c in header for c in CSV_COLUMN_RENAMES) else None
+
+    if pacsv is not None:
+        parse_options = pacsv.ParseOptions(delimiter=',')
+        # An empty include_columns list means "all columns" to pyarrow
+        convert_options = pacsv.ConvertOptions(
+            include_columns=usecols or [], column_types={c: pa.from_numpy_dtype(t) for c, t in dtype.items()})
+        if file_size < CHUNKED_READ_BYTES:
+            return pacsv.read_csv(file_path, parse_options=parse_options,
+                                  convert_options=convert_options).to_pandas()
+        # open_csv is single-threaded, but streaming lets us report progress on big files
+        with pa.memory_map(file_path, 'r') as src:
+            reader = pacsv.open_csv(src, parse_options=parse_options, convert_options=convert_options)
+            batches = []
+            for batch in reader:
+                batches.append(batch)
+                if progress is not None:
+                    progress(min(99, int(100 * src.tell() / file_size)))
+        return pa.Table.from_batches(batches, schema=reader.schema).to_pandas()
+    if file_size >= CHUNKED_READ_BYTES:
+        parts = []
+        with open(file_path, 'rb') as f:
+            for chunk in pd.read_csv(f, usecols=usecols, dtype=dtype, engine='c', chunksize=CSV_CHUNK_ROWS):
+                parts.append(chunk)
+                if progress is not None:
+                    progress(min(99, int(100 * f.tell() / file_size)))
+        return pd.concat(parts, ignore_index=True)
+    return pd.read_csv(file_path, usecols=usecols, dtype=dtype, engine='c')
+
+
+def _range_mean(t, y, start, end):
+    """Mean of the non-NaN y where start <= t <= end, in a single pass over unsorted t."""
+    acc = 0.0
+    n = 0
+    for i in range(t.size):
+        if start <= t[i] <= end and y[i] == y[i]:
+            acc += y[i]
+            n += 1
+    return acc / n if n else np.nan
+
+
+range_mean = njit(cache=True)(_range_mean) if njit is not None else None
+
+
+def warm_up_range_mean():
+    """
+    Compile range_mean for the loaded dtypes (float64 time, float32 thrust) ahead of first use.
+    Both writable and read-only arrays are compiled: numba treats them as different signatures,
+    and pandas' copy-on-write returns read-only arrays from to_numpy().
+    """
+    if range_mean is None:
+        return
+    for writeable in (True, False):
+        t = np.zeros(1, np.float64)
+        y = np.zeros(1, np.float32)
+        t.setflags(write=writeable)
+        y.setflags(write=writeable)
+        range_mean(t, y, np.float64(0.0), np.float64(0.0))
+
+
+class CsvLoaderSignals(QObject):
+    """Signals emitted by CsvLoader; a QRunnable cannot define signals itself."""
+    finished = pyqtSignal(object)  # Parsed DataFrame
+    progress = pyqtSignal(int)  # Percentage of the file read so far
+    error = pyqtSignal(str)  # Error message
+
+
+class CsvLoader(QRunnable):
+    """Parse a CSV file on a worker thread and post the DataFrame back to the GUI."""
+    def __init__(self, file_path):
+        super().__init__()
+        self.file_path = file_path
+        self.signals = CsvLoaderSignals()
+
+    def run(self):
+        try:
+            df = read_thrust_csv(self.file_path, self.signals.progress.emit)
+        except Exception as e:
+            self.signals.error.emit(str(e))
+            return
+
+        try:
+            warm_up_range_mean()  # JIT here so the first average click does not stall the GUI
+        except Exception:
+            pass  # A compile/cache problem must not discard a good parse; it recompiles on use
+        self.signals.finished.emit(df)
+
+
+class PandasModel(QAbstractTableModel):
+    """
+    Read-only table model backed directly by a DataFrame.
+    Cells are fetched on demand, so only the rows Qt actually paints cost anything.
+    DisplayRole gives the exact str() of each value; EditRole/UserRole give the raw Python number.
+    """
+    def __init__(self, df, parent=None):
+        super().__init__(parent)
+        self._df = df
+        # Per-column NumPy arrays: plain indexing is much cheaper than DataFrame.iat per cell
+        self._columns = [df[c].to_numpy() for c in df.columns]
+
+    def rowCount(self, parent=None):
+        return len(self._df)
+
+    def columnCount(self, parent=None):
+        return self._df.shape[1]
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        value = self._columns[index.column()][index.row()]
+        if role == Qt.DisplayRole:
+            # Qt's own number formatting rounds to 6 significant digits, so format here
+            return str(value)
+        if role in (Qt.EditRole, Qt.UserRole):
+            if isinstance(value, (np.integer, np.floating)):
+                return value.item()
+            return str(value)
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return str(self._df.columns[section])
+        return str(section + 1)
+
 
 class ThrustTestingApp(QMainWindow):
     def __init__(self):
@@ -18,6 +218,15 @@ class ThrustTestingApp(QMainWindow):
         self.setWindowTitle("Static Thrust Testing")
         self.setGeometry(100, 100, 1000, 600)
         self.data = None  # Initialize data to None; will hold the CSV data after loading
+        self.time_arr = None  # NumPy view of the time column, cached after loading
+        self.thrust_arr = None  # NumPy view of the thrust column (ozf), cached after loading
+        self.max_thrust_ozf = None  # Maximum thrust (ozf), computed once after loading
+        self.time_sorted = False  # True when the time column is non-decreasing
+        self.thrust_has_nan = False  # True when the thrust column contains missing values
+        self.plot_data_finite = False  # True when time and thrust contain no NaN/inf values
+        self._loader = None  # Keeps the running CsvLoader (and its signals) alive
+        self._start_time = None  # Parsed start time, cached when editing finishes
+        self._end_time = None  # Parsed end time, cached when editing finishes
         self.current_unit = 'ozf'  # Default unit is ounces-force (ozf)
 
         # Main layout setup
@@ -27,38 +236,25 @@ class ThrustTestingApp(QMainWindow):
         main_widget.setLayout(main_layout)
 
         # Left panel: Plot and max thrust display
-        self.plot_canvas = FigureCanvas(Figure(figsize=(5, 4)))  # Canvas for matplotlib plot
-        self.ax = self.plot_canvas.figure.add_subplot(111)  # Create plot axes
+        self.plot_widget = pg.PlotWidget(background='w')  # PyQtGraph plot (pan/zoom built in)
+        self.plot_widget.setLabel('bottom', "Time (s)")
+        self.plot_widget.setLabel('left', "Thrust (ozf)")  # Default label
+        self.legend = self.plot_widget.addLegend()
+        # Single curve item that is updated in place with setData
+        self.curve = self.plot_widget.plot([], [], pen='b', name="Thrust vs Time (ozf)")
 
         # Create a vertical layout for the plot area
         plot_layout = QVBoxLayout()
 
-        # Create the navigation toolbar
-        self.toolbar = NavigationToolbar(self.plot_canvas, self)
-        self.toolbar.setStyleSheet("""
-            QToolBar {
-                background: white;
-                border: none;
-            }
-            QToolButton {
-                background: white;
-                border: none;
-            }
-            QToolButton:hover {
-                background: #f0f0f0;
-            }
-        """)
-
-        # Add both the toolbar and canvas to the plot layout
-        plot_layout.addWidget(self.toolbar)
-        plot_layout.addWidget(self.plot_canvas)
+        # Add the plot to the plot layout
+        plot_layout.addWidget(self.plot_widget)
 
         # Create a widget to hold the plot layout
-        plot_widget = QWidget()
-        plot_widget.setLayout(plot_layout)
+        plot_container = QWidget()
+        plot_container.setLayout(plot_layout)
 
-        # Add the plot widget to the main layout
-        main_layout.addWidget(plot_widget)
+        # Add the plot container to the main layout
+        main_layout.addWidget(plot_container)
 
         # Right panel: Controls and metrics
         side_panel = QVBoxLayout()
@@ -68,6 +264,12 @@ class ThrustTestingApp(QMainWindow):
         self.load_button.clicked.connect(self.load_csv)  # Connect button to file loader function
         side_panel.addWidget(self.load_button)
 
+        # Progress bar shown while a CSV file is loading
+        self.load_progress = QProgressBar()
+        self.load_progress.setRange(0, 100)
+        self.load_progress.setVisible(False)
+        side_panel.addWidget(self.load_progress)
+
         # Max thrust display title
         self.max_label_title = QLabel("Maximum Thrust:")
         self.max_label_title.setStyleSheet("font-weight: bold; font-size: 14px;")
@@ -87,16 +289,27 @@ class ThrustTestingApp(QMainWindow):
         self.avg_calc_label.setStyleSheet("font-size: 14px; font-weight: bold;")
         side_panel.addWidget(self.avg_calc_label)
 
-        # Input fields for start and end times
+        # Input fields for start and end times; the validator rejects non-numeric keystrokes
+        time_validator = QDoubleValidator(self)
+        time_validator.setLocale(QLocale.c())  # Match float() parsing ('.' decimal point)
+
         hbox_avg_range = QHBoxLayout()
         self.start_time_input = QLineEdit(self)
         self.start_time_input.setPlaceholderText("Start Time")
         self.start_time_input.setFixedWidth(100)
+        self.start_time_input.setValidator(time_validator)
+        self.start_time_input.textEdited.connect(lambda: setattr(self, '_start_time', None))
+        self.start_time_input.editingFinished.connect(
+            lambda: setattr(self, '_start_time', self._parse_time_input(self.start_time_input)))
         hbox_avg_range.addWidget(self.start_time_input)
 
         self.end_time_input = QLineEdit(self)
         self.end_time_input.setPlaceholderText("End Time")
         self.end_time_input.setFixedWidth(100)
+        self.end_time_input.setValidator(time_validator)
+        self.end_time_input.textEdited.connect(lambda: setattr(self, '_end_time', None))
+        self.end_time_input.editingFinished.connect(
+            lambda: setattr(self, '_end_time', self._parse_time_input(self.end_time_input)))
         hbox_avg_range.addWidget(self.end_time_input)
 
         # Add the time range input to the side panel
@@ -132,25 +345,22 @@ class ThrustTestingApp(QMainWindow):
         if self.current_unit == 'ozf':
             # Convert to lbf
             self.current_unit = 'lbf'
-            self.data['thrust_converted'] = self.data['thrust'] / 16  # 1 lbf = 16 ozf
+            scale = 1 / 16  # 1 lbf = 16 ozf
             y_label = "Thrust (lbf)"
         else:
             # Switch back to ozf
             self.current_unit = 'ozf'
-            self.data['thrust_converted'] = self.data['thrust']  # Use original values in ozf
+            scale = 1.0  # Use original values in ozf
             y_label = "Thrust (ozf)"
 
-        # Update the plot with converted data
-        self.ax.clear()
-        self.ax.plot(self.data['time'], self.data['thrust_converted'],
-                     label=f"Thrust vs Time ({self.current_unit.upper()})")
-        self.ax.set_xlabel("Time (s)")
-        self.ax.set_ylabel(y_label)  # Update the y-axis label
-        self.ax.legend()
-        self.plot_canvas.draw()
+        # Update only the curve's y values; converted values are never stored
+        thrust_converted = self.thrust_arr if scale == 1.0 else self.thrust_arr * scale
+        self.curve.setData(self.time_arr, thrust_converted, skipFiniteCheck=self.plot_data_finite)
+        self.plot_widget.setLabel('left', y_label)  # Update the y-axis label
+        self.legend.getLabel(self.curve).setText(f"Thrust vs Time ({self.current_unit.upper()})")
 
         # Update the maximum thrust display
-        max_thrust_converted = self.data['thrust_converted'].max()
+        max_thrust_converted = self.max_thrust_ozf * scale
         self.max_label.setText(f"{max_thrust_converted:.2f} {self.current_unit}")
 
     def load_csv(self):
@@ -162,34 +372,81 @@ class ThrustTestingApp(QMainWindow):
         if not file_path:
             return
 
+        # Parse the file off the GUI thread; the result arrives in _on_csv_loaded
+        self.load_button.setEnabled(False)
+        self.load_progress.setValue(0)
+        self.load_progress.setVisible(True)
+        self._loader = CsvLoader(file_path)
+        self._loader.signals.progress.connect(self.load_progress.setValue)
+        self._loader.signals.finished.connect(self._on_csv_loaded)
+        self._loader.signals.error.connect(self._on_csv_error)
+        QThreadPool.globalInstance().start(self._loader)
+
+    def _on_csv_loaded(self, df):
+        """Validate the parsed DataFrame and display the initial plot."""
+        self._loader = None
+        self.load_button.setEnabled(True)
+        self.load_progress.setVisible(False)
+
+        # Validate and prepare everything in locals; the previous file's state is kept on failure
         try:
-            # Read the CSV file into a pandas DataFrame
-            self.data = pd.read_csv(file_path)
-
             # Ensure the required columns are present
-            self.data.rename(columns={'Time (s)': 'time', 'Thrust (ozf)': 'thrust'}, inplace=True)
-            if 'time' not in self.data.columns or 'thrust' not in self.data.columns:
+            df.rename(columns=CSV_COLUMN_RENAMES, inplace=True)
+            if 'time' not in df.columns or 'thrust' not in df.columns:
                 QMessageBox.critical(self, "Error", "CSV must contain 'time' and 'thrust' columns!")
                 return
 
-            # Copy the thrust column to a new column for conversion (starts as ozf)
-            self.data['thrust_converted'] = self.data['thrust']
-
-            # Plot the time vs thrust data (default: ozf)
-            self.ax.clear()
-            self.ax.plot(self.data['time'], self.data['thrust_converted'], label="Thrust vs Time (ozf)")
-            self.ax.set_xlabel("Time (s)")
-            self.ax.set_ylabel("Thrust (ozf)")  # Default label
-            self.ax.legend()
-            self.plot_canvas.draw()
-
-            # Display the maximum thrust in ozf
-            max_thrust = self.data['thrust'].max()
-            self.max_label.setText(f"{max_thrust:.2f} ozf")
-
+            # Downcast thrust to float32 to halve memory and bandwidth for reductions and plotting;
+            # time stays float64 so the average window edges compare exactly as typed
+            df['time'] = df['time'].astype(np.float64, copy=False)
+            df['thrust'] = df['thrust'].astype(np.float32, copy=False)
+
+            # Cache the raw NumPy arrays so later operations skip pandas indexing
+            time_arr = df['time'].to_numpy()
+            thrust_arr = df['thrust'].to_numpy()
+            time_sorted = bool(np.all(time_arr[1:] >= time_arr[:-1]))
+            thrust_has_nan = bool(np.isnan(thrust_arr).any())
+            # Checked once here so redraws can skip PyQtGraph's per-update finite scan
+            plot_data_finite = bool(np.isfinite(time_arr).all() and np.isfinite(thrust_arr).all())
+            if not thrust_arr.size:
+                max_thrust_ozf = np.nan  # Header-only file
+            elif thrust_has_nan:
+                max_thrust_ozf = nanmax(thrust_arr)
+            else:
+                max_thrust_ozf = thrust_arr.max()
         except Exception as e:
-            # Handle errors in loading and processing the file
-            QMessageBox.critical(self, "Error", f"Failed to load CSV: {str(e)}")
+            # Handle errors in processing the file
+            self._on_csv_error(str(e))
+            return
+
+        self.data = df
+        self.time_arr = time_arr
+        self.thrust_arr = thrust_arr
+        self.time_sorted = time_sorted
+        self.thrust_has_nan = thrust_has_nan
+        self.plot_data_finite = plot_data_finite
+        self.max_thrust_ozf = max_thrust_ozf
+
+        # Peak downsampling and view clipping keep the drawn segment count near the pixel width,
+        # but both assume increasing x, so out-of-order logs are drawn in full
+        self.curve.setClipToView(self.time_sorted)
+        self.curve.setDownsampling(auto=self.time_sorted, method='peak')
+
+        # Plot the time vs thrust data (default: ozf)
+        self.current_unit = 'ozf'
+        self.curve.setData(self.time_arr, self.thrust_arr, skipFiniteCheck=self.plot_data_finite)
+        self.plot_widget.setLabel('left', "Thrust (ozf)")  # Default label
+        self.legend.getLabel(self.curve).setText("Thrust vs Time (ozf)")
+
+        # Display the maximum thrust in ozf
+        self.max_label.setText(f"{self.max_thrust_ozf:.2f} ozf")
+
+    def _on_csv_error(self, message):
+        """Report a failure to load or process the CSV file."""
+        self._loader = None
+        self.load_button.setEnabled(True)
+        self.load_progress.setVisible(False)
+        QMessageBox.critical(self, "Error", f"Failed to load CSV: {message}")
 
     def calculate_average(self):
         """Calculate the average thrust between two time points."""
@@ -197,24 +454,59 @@ class ThrustTestingApp(QMainWindow):
             QMessageBox.warning(self, "Warning", "Please load a CSV file first!")
             return
 
-        try:
-            start_time = float(self.start_time_input.text())
-            end_time = float(self.end_time_input.text())
+        # Use the values cached on editingFinished; parse only if a field is still being edited
+        start_time = self._start_time
+        if start_time is None:
+            start_time = self._parse_time_input(self.start_time_input)
+        end_time = self._end_time
+        if end_time is None:
+            end_time = self._parse_time_input(self.end_time_input)
 
-            if start_time >= end_time:
-                QMessageBox.warning(self, "Warning", "Start time must be less than end time!")
-                return
+        if np.isnan(start_time) or np.isnan(end_time):
+            QMessageBox.warning(self, "Warning", "Please enter valid numbers for the time range.")
+            return
 
-            # Filter data within the time range
-            mask = (self.data['time'] >= start_time) & (self.data['time'] <= end_time)
-            avg_thrust = self.data.loc[mask, 'thrust'].mean()
+        if start_time >= end_time:
+            QMessageBox.warning(self, "Warning", "Start time must be less than end time!")
+            return
 
-            if np.isnan(avg_thrust):
-                self.avg_result_label.setText("No data in range!")
-            else:
-                self.avg_result_label.setText(f"Average Thrust: {avg_thrust:.2f} N")
+        avg_thrust = self._average_in_range(start_time, end_time)
+        if np.isnan(avg_thrust):
+            self.avg_result_label.setText("No data in range!")
+        else:
+            self.avg_result_label.setText(f"Average Thrust: {avg_thrust:.2f} N")
+
+    @staticmethod
+    def _parse_time_input(line_edit):
+        """Parse a time input field, returning NaN for empty or partial input."""
+        try:
+            return float(line_edit.text())
         except ValueError:
-            QMessageBox.warning(self, "Warning", "Please enter valid numbers for the time range.")
+            return np.nan
+
+    def _average_in_range(self, start_time, end_time):
+        """Mean thrust (ozf) for start_time <= time <= end_time, or NaN when the range is empty."""
+        # Compare in the time column's dtype so every path below agrees at the range edges
+        start_time = self.time_arr.dtype.type(start_time)
+        end_time = self.time_arr.dtype.type(end_time)
+        if self.time_sorted:
+            # Binary search for the slice bounds instead of building a mask
+            lo = np.searchsorted(self.time_arr, start_time, side='left')
+            hi = np.searchsorted(self.time_arr, end_time, side='right')
+            selected = self.thrust_arr[lo:hi]
+        elif range_mean is not None:
+            # Fused compare-and-accumulate loop, precompiled on the loader thread
+            return range_mean(self.time_arr, self.thrust_arr, start_time, end_time)
+        else:
+            mask = (self.time_arr >= start_time) & (self.time_arr <= end_time)
+            selected = self.thrust_arr[mask]
+
+        # Plain ndarray reductions skip the NaN-aware path for clean data
+        if not selected.size:
+            return np.nan
+        if self.thrust_has_nan:
+            return nanmean(selected)
+        return selected.mean()
 
     def show_dataframe(self):
         """Display the DataFrame in a table view."""
@@ -230,16 +522,9 @@ class ThrustTestingApp(QMainWindow):
         layout = QVBoxLayout()
         df_window.setLayout(layout)
 
+        # Populate the view; the model reads from the DataFrame lazily
         table = QTableView()
-        model = QStandardItemModel()
-
-        # Populate the view
-        model.setHorizontalHeaderLabels(self.data.columns.tolist())
-        for row in self.data.itertuples(index=False):
-            items = [QStandardItem(str(item)) for item in row]
-            model.appendRow(items)
-
-        table.setModel(model)
+        table.setModel(PandasModel(self.data, table))
         layout.addWidget(table)
 
         df_window.show()